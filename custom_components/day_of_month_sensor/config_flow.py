@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -30,19 +31,90 @@ from .const import (
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# The user step schema depends only on constants, so build it once at
+# import time instead of on every form render
+_STEP_USER_SCHEMA: vol.Schema = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                filter={"domain": SENSOR_DOMAIN},
+                multiple=False,
+            ),
+        ),
+        vol.Required(CONF_TRACK_VALUE): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(TRACK_VALUE_OPTIONS),
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+        vol.Required(CONF_AGGREGATION): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(AGGREGATION_OPTIONS),
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+        vol.Required(CONF_HISTORIC_RANGE): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(HISTORIC_RANGE_OPTIONS),
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+        vol.Required(CONF_UPDATE_FREQUENCY): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(UPDATE_FREQUENCY_OPTIONS),
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _validate_state_values(
+    state_class: str | None, state_value: str
+) -> tuple[bool, str | None]:
+    """Validate the state class and state value of an entity.
+
+    This pure helper performs the state class membership test and numeric
+    state parse. It is cached so repeated validations of the same state
+    (e.g. resubmitted config flow forms) are O(1).
+
+    Args:
+        state_class: The state class attribute of the entity, if any.
+        state_value: The state value of the entity.
+
+    Returns:
+        tuple[bool, str | None]: A tuple containing:
+            - bool: True if the state is valid, False otherwise.
+            - str | None: Error message if validation failed, None otherwise.
+    """
+    if not state_class or state_class not in VALID_STATE_CLASSES:
+        return False, (
+            f"Entity must have one of these state classes: "
+            f"{', '.join(sorted(VALID_STATE_CLASSES))}"
+        )
+
+    # Check if the entity has a numeric state
+    try:
+        float(state_value)
+    except (ValueError, TypeError):
+        return False, "Entity must have a numeric state"
+
+    return True, None
+
 
 async def validate_entity_id(
     hass: HomeAssistant, entity_id: str
 ) -> tuple[bool, str | None]:
     """Validate that the entity ID is a numeric sensor with a valid state class.
-    
+
     This function checks if the entity exists, is a sensor, has a valid state class,
     and has a numeric state value.
-    
+
     Args:
         hass: The Home Assistant instance.
         entity_id: The entity ID to validate.
-        
+
     Returns:
         tuple[bool, str | None]: A tuple containing:
             - bool: True if the entity is valid, False otherwise.
@@ -50,32 +122,21 @@ async def validate_entity_id(
     """
     entity_registry: EntityRegistry = er.async_get(hass)
     entity_entry: RegistryEntry | None = entity_registry.async_get(entity_id)
-    
+
     if not entity_entry:
         return False, "Entity not found"
-    
+
     if not entity_entry.domain == SENSOR_DOMAIN:
         return False, "Entity is not a sensor"
-    
-    # Check if the entity has a valid state class
+
+    # Check the state class and state value via the cached helper
     state: State | None = hass.states.get(entity_id)
     if not state:
         return False, "Entity state not available"
-    
-    state_class: str | None = state.attributes.get("state_class")
-    if not state_class or state_class not in VALID_STATE_CLASSES:
-        return False, (
-            f"Entity must have one of these state classes: "
-            f"{', '.join(VALID_STATE_CLASSES)}"
-        )
-    
-    # Check if the entity has a numeric state
-    try:
-        float(state.state)
-    except (ValueError, TypeError):
-        return False, "Entity must have a numeric state"
-    
-    return True, None
+
+    return _validate_state_values(
+        state.attributes.get("state_class"), state.state
+    )
 
 
 class DayOfMonthSensorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -121,45 +182,6 @@ class DayOfMonthSensorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-        # Get the entity registry
-        er.async_get(self.hass)
-
-        # Build the schema
-        schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        filter={"domain": SENSOR_DOMAIN},
-                        multiple=False,
-                    ),
-                ),
-                vol.Required(CONF_TRACK_VALUE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=TRACK_VALUE_OPTIONS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_AGGREGATION): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=AGGREGATION_OPTIONS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_HISTORIC_RANGE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=HISTORIC_RANGE_OPTIONS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_UPDATE_FREQUENCY): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=UPDATE_FREQUENCY_OPTIONS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=schema, errors=errors
+            step_id="user", data_schema=_STEP_USER_SCHEMA, errors=errors
         )
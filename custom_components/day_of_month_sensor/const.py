@@ -16,12 +16,12 @@ TRACK_VALUE_MIN: Final = "min"
 TRACK_VALUE_MAX: Final = "max"
 TRACK_VALUE_STATE: Final = "state"
 
-TRACK_VALUE_OPTIONS: Final = [
+TRACK_VALUE_OPTIONS: Final = (
     TRACK_VALUE_MEAN,
     TRACK_VALUE_MIN,
     TRACK_VALUE_MAX,
     TRACK_VALUE_STATE,
-]
+)
 
 # Aggregation options
 AGGREGATION_MAXIMUM: Final = "maximum"
@@ -30,38 +30,38 @@ AGGREGATION_MEDIAN: Final = "median"
 AGGREGATION_MEAN: Final = "mean"
 AGGREGATION_STD_DEV: Final = "standard deviation"
 
-AGGREGATION_OPTIONS: Final = [
+AGGREGATION_OPTIONS: Final = (
     AGGREGATION_MAXIMUM,
     AGGREGATION_MINIMUM,
     AGGREGATION_MEDIAN,
     AGGREGATION_MEAN,
     AGGREGATION_STD_DEV,
-]
+)
 
 # Historic range options
 HISTORIC_RANGE_ANNUAL: Final = "annual"
 HISTORIC_RANGE_MONTHLY: Final = "monthly"
 
-HISTORIC_RANGE_OPTIONS: Final = [
+HISTORIC_RANGE_OPTIONS: Final = (
     HISTORIC_RANGE_ANNUAL,
     HISTORIC_RANGE_MONTHLY,
-]
+)
 
 # Update frequency options
 UPDATE_FREQUENCY_HOURLY: Final = "hourly"
 UPDATE_FREQUENCY_DAILY: Final = "daily"
 
-UPDATE_FREQUENCY_OPTIONS: Final = [
+UPDATE_FREQUENCY_OPTIONS: Final = (
     UPDATE_FREQUENCY_HOURLY,
     UPDATE_FREQUENCY_DAILY,
-]
+)
 
 # Valid state classes for source entities
-VALID_STATE_CLASSES: Final = [
+VALID_STATE_CLASSES: Final = frozenset({
     "measurement",
     "total",
     "total_increasing",
-]
+})
 
 # Attributes
 ATTR_TRACK_VALUE: Final = "track_value"
@@ -1,10 +1,16 @@
 """Platform for Day of Month Sensor integration."""
 from __future__ import annotations
 
+import asyncio
+import calendar
 import logging
-from datetime import datetime, timedelta
+import math
+from dataclasses import dataclass
+from functools import cached_property
+from datetime import date, datetime, timedelta
 import statistics
-from typing import Any, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import (
@@ -17,13 +23,18 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+)
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    DOMAIN,
     CONF_ENTITY_ID,
     CONF_TRACK_VALUE,
     CONF_AGGREGATION,
@@ -39,9 +50,7 @@ from .const import (
     AGGREGATION_MEAN,
     AGGREGATION_STD_DEV,
     HISTORIC_RANGE_ANNUAL,
-    HISTORIC_RANGE_MONTHLY,
     UPDATE_FREQUENCY_HOURLY,
-    UPDATE_FREQUENCY_DAILY,
     ATTR_TRACK_VALUE,
     ATTR_AGGREGATION,
     ATTR_HISTORIC_RANGE,
@@ -49,18 +58,60 @@ from .const import (
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_ONE_DAY: timedelta = timedelta(days=1)
+
+# Bound concurrent recorder jobs so many sensors starting at once (or
+# firing on the same aligned tick) don't starve the recorder's executor
+_RECORDER_SEMAPHORE: asyncio.Semaphore = asyncio.Semaphore(3)
+
+# Mapping from track value option to the statistic field it consumes
+_TRACK_TO_STAT: dict[str, str] = {
+    TRACK_VALUE_MEAN: "mean",
+    TRACK_VALUE_MIN: "min",
+    TRACK_VALUE_MAX: "max",
+    TRACK_VALUE_STATE: "state",
+}
+
+# Mapping from aggregation option to the function that computes it
+_AGG_FUNCS: dict[str, Callable[[Iterable[float]], float]] = {
+    AGGREGATION_MAXIMUM: max,
+    AGGREGATION_MINIMUM: min,
+    AGGREGATION_MEDIAN: statistics.median,
+    AGGREGATION_MEAN: statistics.fmean,
+    AGGREGATION_STD_DEV: statistics.stdev,
+}
+
+
+# Fast-path converters keyed by exact type; recorder rows carry numeric
+# timestamps, so the common case resolves with one dict lookup instead of
+# walking the isinstance chain
+_TIMESTAMP_CONVERTERS: dict[type, Callable[[Any], Optional[datetime]]] = {
+    float: dt_util.utc_from_timestamp,
+    int: dt_util.utc_from_timestamp,
+    datetime: lambda value: value,
+}
+
 
 def safe_convert_to_datetime(timestamp_value: Any) -> Optional[datetime]:
     """Safely convert a timestamp value to a datetime object.
-    
+
     Args:
-        timestamp_value: The timestamp value to convert, can be a float, int, 
+        timestamp_value: The timestamp value to convert, can be a float, int,
                         string, or datetime object.
-                        
+
     Returns:
-        Optional[datetime]: A datetime object if conversion was successful, 
+        Optional[datetime]: A datetime object if conversion was successful,
                            None otherwise.
     """
+    converter = _TIMESTAMP_CONVERTERS.get(type(timestamp_value))
+    if converter is not None:
+        try:
+            return converter(timestamp_value)
+        except Exception as ex:
+            _LOGGER.error("Error converting timestamp %s: %s", timestamp_value, ex)
+            return None
+
+    # Fall back to the isinstance chain for strings and subclasses
     try:
         if isinstance(timestamp_value, (int, float)):
             # Convert numeric timestamp to datetime
@@ -83,6 +134,111 @@ def safe_convert_to_datetime(timestamp_value: Any) -> Optional[datetime]:
         return None
 
 
+@dataclass(frozen=True, slots=True)
+class SensorConfig:
+    """Immutable configuration for a Day of Month Sensor.
+
+    Holding the per-sensor options in one slotted dataclass keeps them out
+    of the entity's instance dict, shrinking per-sensor memory use.
+    """
+
+    entry_id: str
+    entity_id: str
+    track_value: str
+    aggregation: str
+    historic_range: str
+    update_frequency: str
+
+
+def _iter_stat_values(
+    stats: list[dict[str, Any]], stat_key: str
+) -> Iterator[float]:
+    """Yield the tracked statistic field from each record as a float.
+
+    Records missing the field or holding a non-numeric value are skipped
+    (the latter with an error log).
+
+    Args:
+        stats: The statistics records to extract values from.
+        stat_key: The statistic field to extract.
+
+    Yields:
+        float: The extracted values.
+    """
+    for stat in stats:
+        value = stat.get(stat_key)
+        if value is None:
+            continue
+        try:
+            yield float(value)
+        except (ValueError, TypeError) as ex:
+            _LOGGER.error("Error extracting value from stat: %s - %s", stat, ex)
+
+
+def _welford(values: Iterable[float]) -> tuple[int, float, float]:
+    """Compute count, mean and sum of squared deviations in one pass.
+
+    Implements Welford's online algorithm so that standard deviation can be
+    derived from a value stream without materializing a list or scanning it
+    twice.
+
+    Args:
+        values: The values to accumulate.
+
+    Returns:
+        tuple[int, float, float]: The sample count, the mean, and the sum of
+            squared deviations from the mean (M2).
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    return count, mean, m2
+
+
+def _fetch_statistics_for_windows(
+    hass: HomeAssistant,
+    windows: list[tuple[datetime, datetime]],
+    entity_id: str,
+    period: str,
+    types: set[str],
+) -> list[list[dict[str, Any]]]:
+    """Fetch statistics for several time windows in a single executor job.
+
+    This function runs in the recorder's executor and issues one
+    statistics_during_period query per window. Doing all windows in one job
+    avoids an executor round trip per target date.
+
+    Args:
+        hass: The Home Assistant instance.
+        windows: List of (start_time, end_time) UTC datetime pairs.
+        entity_id: The entity ID to fetch statistics for.
+        period: The statistics period ("hour" or "day").
+        types: The statistic types to retrieve.
+
+    Returns:
+        list[list[dict[str, Any]]]: The statistics records per window, in
+            window order.
+    """
+    window_stats: list[list[dict[str, Any]]] = []
+    for start_time, end_time in windows:
+        stats_result: dict[str, list[dict[str, Any]]] = statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            [entity_id],
+            period,
+            None,  # No units conversion
+            types,
+        )
+        window_stats.append(stats_result.get(entity_id, []))
+    return window_stats
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -107,21 +263,20 @@ async def async_setup_entry(
     historic_range: str = config_entry.data[CONF_HISTORIC_RANGE]
     update_frequency: str = config_entry.data[CONF_UPDATE_FREQUENCY]
 
-    # Create and add the sensor entity
-    async_add_entities(
-        [
-            DayOfMonthSensor(
-                hass,
-                config_entry.entry_id,
-                entity_id,
-                track_value,
-                aggregation,
-                historic_range,
-                update_frequency,
-            )
-        ],
-        True,
-    )
+    # Build all entities for this entry up front and add them in one batch
+    # so the platform schedules their initial updates together
+    entities: list[DayOfMonthSensor] = [
+        DayOfMonthSensor(
+            hass,
+            config_entry.entry_id,
+            entity_id,
+            track_value,
+            aggregation,
+            historic_range,
+            update_frequency,
+        )
+    ]
+    async_add_entities(entities, True)
 
 
 class DayOfMonthSensor(SensorEntity, RestoreEntity):
@@ -155,28 +310,70 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
             None
         """
         self.hass: HomeAssistant = hass
-        self._entry_id: str = entry_id
-        self._entity_id: str = entity_id
-        self._track_value: str = track_value
-        self._aggregation: str = aggregation
-        self._historic_range: str = historic_range
-        self._update_frequency: str = update_frequency
-        
-        # Set up entity attributes
-        entity_name: str = entity_id.split('.')[-1]
-        self._attr_name: str = f"Day of Month {aggregation.capitalize()} of {entity_name}"
-        self._attr_unique_id: str = f"{entry_id}_{entity_id}"
-        self._attr_extra_state_attributes: dict[str, str] = {
-            ATTR_TRACK_VALUE: track_value,
-            ATTR_AGGREGATION: aggregation,
-            ATTR_HISTORIC_RANGE: historic_range,
-        }
+        self._config: SensorConfig = SensorConfig(
+            entry_id,
+            entity_id,
+            track_value,
+            aggregation,
+            historic_range,
+            update_frequency,
+        )
+        # Resolve the option strings into their dispatch forms once so the
+        # update path never compares configuration strings
+        self._stat_key: str = _TRACK_TO_STAT[track_value]
+        self._aggregator: Callable[[Iterable[float]], float] = _AGG_FUNCS[aggregation]
+        self._is_hourly: bool = update_frequency == UPDATE_FREQUENCY_HOURLY
+        self._is_annual: bool = historic_range == HISTORIC_RANGE_ANNUAL
         
+        # Derived attributes (name, unique_id, extra state attributes) are
+        # built lazily via cached_property on first access
+
         # Will be set in async_added_to_hass
         self._remove_update_listener: Optional[Callable[[], None]] = None
+        # Set after each successful update to skip redundant fetches
+        self._last_update_ts: Optional[datetime] = None
+        self._last_day: Optional[tuple[int, int]] = None
+        # Statistics for completed target days, keyed by local date; those
+        # days never change, so they are fetched at most once
+        self._window_cache: dict[date, list[dict[str, Any]]] = {}
         self._attr_native_value: Optional[float] = None
         self._attr_native_unit_of_measurement: Optional[str] = None
 
+    @cached_property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        entity_id: str = self._config.entity_id
+        entity_name: str = entity_id.rpartition('.')[2] or entity_id
+        return (
+            f"Day of Month {self._config.aggregation.capitalize()} "
+            f"of {entity_name}"
+        )
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Return the unique ID of the sensor."""
+        return f"{self._config.entry_id}_{self._config.entity_id}"
+
+    @cached_property
+    def extra_state_attributes(self) -> Mapping[str, str]:
+        """Return the state attributes of the sensor."""
+        # The attributes never change after construction; a read-only proxy
+        # lets state writes reuse the same mapping safely
+        return MappingProxyType(
+            {
+                ATTR_TRACK_VALUE: self._config.track_value,
+                ATTR_AGGREGATION: self._config.aggregation,
+                ATTR_HISTORIC_RANGE: self._config.historic_range,
+            }
+        )
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Return sensor specific state data to be persisted for restore."""
+        return RestoredExtraData(
+            {"native_unit_of_measurement": self._attr_native_unit_of_measurement}
+        )
+
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added.
         
@@ -205,38 +402,75 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
                 self._attr_native_value = None
             
             # Restore attributes
-            if ATTR_UNIT_OF_MEASUREMENT in state.attributes:
-                self._attr_native_unit_of_measurement = state.attributes[
-                    ATTR_UNIT_OF_MEASUREMENT
-                ]
-        
-        # Get the unit of measurement from the source entity
-        source_state: Optional[State] = self.hass.states.get(self._entity_id)
-        if source_state and ATTR_UNIT_OF_MEASUREMENT in source_state.attributes:
-            self._attr_native_unit_of_measurement = source_state.attributes[
-                ATTR_UNIT_OF_MEASUREMENT
-            ]
+            restored_uom = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if restored_uom is not None:
+                self._attr_native_unit_of_measurement = restored_uom
+
+        # The persisted extra data survives restarts even when the last
+        # state had no unit attribute
+        if (extra_data := await self.async_get_last_extra_data()) is not None:
+            persisted_uom = extra_data.as_dict().get("native_unit_of_measurement")
+            if persisted_uom is not None:
+                self._attr_native_unit_of_measurement = persisted_uom
+
+        # Fall back to the source entity, which may not be populated yet
+        # on a cold boot
+        if self._attr_native_unit_of_measurement is None:
+            source_state: Optional[State] = self.hass.states.get(self._config.entity_id)
+            if source_state is not None:
+                source_uom = source_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if source_uom is not None:
+                    self._attr_native_unit_of_measurement = source_uom
         
-        # Set up update interval based on configuration
-        if self._update_frequency == UPDATE_FREQUENCY_HOURLY:
-            # Update every hour at the beginning of the hour
-            self._remove_update_listener = async_track_time_interval(
+        # Follow the source entity so the unit is picked up when the source
+        # appears after a cold boot and tracks any later changes
+        self.async_on_remove(
+            async_track_state_change_event(
                 self.hass,
-                self._async_update,
-                timedelta(hours=1),
-                cancel_on_shutdown=True,
+                [self._config.entity_id],
+                self._async_source_changed,
+            )
+        )
+
+        # Schedule updates aligned to the top of the hour / local midnight
+        # rather than an interval anchored at startup time; this matches
+        # the statistics buckets and lets all instances fire on one tick
+        if self._is_hourly:
+            self._remove_update_listener = async_track_time_change(
+                self.hass, self._async_update, minute=0, second=0
             )
         else:  # UPDATE_FREQUENCY_DAILY
-            # Update once a day at midnight
-            self._remove_update_listener = async_track_time_interval(
-                self.hass,
-                self._async_update,
-                timedelta(days=1),
-                cancel_on_shutdown=True,
+            self._remove_update_listener = async_track_time_change(
+                self.hass, self._async_update, hour=0, minute=0, second=0
             )
-        
-        # Do an initial update
-        await self._async_update(None)
+
+        # Schedule the initial update instead of awaiting it, so adding the
+        # entity isn't blocked on a recorder round trip; many entities can
+        # then register in parallel at startup
+        self.async_on_remove(
+            async_call_later(self.hass, 0, self._async_update)
+        )
+
+    @callback
+    def _async_source_changed(self, event: Event) -> None:
+        """Handle source entity state changes to keep the unit in sync.
+
+        Args:
+            event: The state change event for the source entity.
+
+        Returns:
+            None
+        """
+        new_state: Optional[State] = event.data.get("new_state")
+        if new_state is None:
+            return
+        source_uom = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (
+            source_uom is not None
+            and source_uom != self._attr_native_unit_of_measurement
+        ):
+            self._attr_native_unit_of_measurement = source_uom
+            self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity will be removed from hass.
@@ -265,44 +499,66 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
         Returns:
             list[datetime]: A list of datetime objects representing the target dates.
         """
+        # The result only depends on the historic range and today's date,
+        # so share it across sensors via hass.data until the day rolls over
+        cache: dict[tuple[str, date], list[datetime]] = self.hass.data[
+            DOMAIN
+        ].setdefault("_target_dates_cache", {})
+        today: date = now.date()
+        cache_key: tuple[str, date] = (self._config.historic_range, today)
+        cached_dates = cache.get(cache_key)
+        if cached_dates is not None:
+            return cached_dates
+
+        # Evict entries from previous days
+        for stale_key in [key for key in cache if key[1] != today]:
+            del cache[stale_key]
+
         target_dates = []
         current_date = now
-        
+
         # For annual range, we look back up to 10 years
         # For monthly range, we look back up to 12 months
-        max_lookback = 10 if self._historic_range == HISTORIC_RANGE_ANNUAL else 12
-        lookback_unit = 'years' if self._historic_range == HISTORIC_RANGE_ANNUAL else 'months'
+        max_lookback = 10 if self._is_annual else 12
+        lookback_unit = 'years' if self._is_annual else 'months'
         
         _LOGGER.debug(
             "Generating target dates for historic range: %s (current day: %d, month: %d)",
-            self._historic_range,
+            self._config.historic_range,
             now.day,
             now.month
         )
         
         # Start with current date and go back in time
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
         for i in range(max_lookback):
             if lookback_unit == 'years':
                 # Go back i years from now
-                target_date = current_date.replace(year=current_date.year - i)
+                year = current_date.year - i
+                month = current_date.month
             else:  # months
-                # Go back i months from now
-                year_diff = i // 12
-                month = current_date.month - (i % 12)
-                if month <= 0:
-                    month += 12
-                    year_diff += 1
-                target_date = current_date.replace(year=current_date.year - year_diff, month=month)
-            
-            # Handle cases where the day doesn't exist in the target month (e.g., Feb 29)
-            try:
-                target_date = target_date.replace(day=now.day)
-                target_dates.append(target_date)
-                _LOGGER.debug("Added target date: %s", target_date)
-            except ValueError:
-                _LOGGER.debug("Skipping invalid date (day doesn't exist in month): %s", target_date)
+                # Go back i months from now; floor division handles the
+                # year rollover without a conditional correction
+                total_months = current_date.month - 1 - i
+                year = current_date.year + total_months // 12
+                month = total_months % 12 + 1
+
+            # Skip months that don't contain today's day (e.g. Feb 29)
+            # before calling replace, so no exception machinery is needed
+            if now.day > calendar.monthrange(year, month)[1]:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Skipping invalid date (day %d doesn't exist in %d-%02d)",
+                        now.day, year, month
+                    )
                 continue
-        
+
+            target_date = current_date.replace(year=year, month=month, day=now.day)
+            target_dates.append(target_date)
+            if debug_enabled:
+                _LOGGER.debug("Added target date: %s", target_date)
+
+        cache[cache_key] = target_dates
         return target_dates
 
     async def _async_update(self, _now: Optional[datetime] = None) -> None:
@@ -321,62 +577,115 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
         """
         # Get the current date
         now: datetime = dt_util.now()
-        
+        previous_value: Optional[float] = self._attr_native_value
+
+        # Skip the recorder fetch entirely when the source entity has not
+        # changed since the last successful update on the same calendar day:
+        # the query would return identical data
+        if self._last_update_ts is not None and self._last_day == (now.day, now.month):
+            source_state: Optional[State] = self.hass.states.get(self._config.entity_id)
+            if (
+                source_state is not None
+                and source_state.last_updated <= self._last_update_ts
+            ):
+                _LOGGER.debug(
+                    "Skipping update for %s: no new source data since %s",
+                    self._config.entity_id,
+                    self._last_update_ts,
+                )
+                return
+
         # Get statistics for the entity
         try:
-            if self._update_frequency == UPDATE_FREQUENCY_DAILY:
+            if not self._is_hourly:
                 # For daily updates, we only want the last value for each day
-                _LOGGER.debug("Fetching daily statistics for entity: %s", self._entity_id)
-                stats: list[dict[str, Any]] = await get_instance(self.hass).async_add_executor_job(
-                    get_last_statistics,
-                    self.hass,
-                    1,  # Get the most recent statistic
-                    self._entity_id,
-                    True,  # Include the current day
-                    {"mean", "min", "max", "state"},  # Statistic types to retrieve
-                )
+                _LOGGER.debug("Fetching daily statistics for entity: %s", self._config.entity_id)
+                async with _RECORDER_SEMAPHORE:
+                    last_stats: dict[str, list[dict[str, Any]]] = await get_instance(self.hass).async_add_executor_job(
+                        get_last_statistics,
+                        self.hass,
+                        1,  # Get the most recent statistic
+                        self._config.entity_id,
+                        True,  # convert_units: return values in display units
+                        {self._stat_key},  # Only the statistic type actually consumed
+                    )
+                # Like statistics_during_period, the result is keyed by
+                # statistic_id; unwrap the rows for our entity
+                stats = last_stats.get(self._config.entity_id, [])
                 _LOGGER.debug("Retrieved %d daily statistics records", len(stats))
             else:
                 # For hourly updates, get statistics only for the target dates
                 target_dates = self._generate_target_dates(now)
                 _LOGGER.debug(
                     "Fetching hourly statistics for entity: %s (for %d specific dates)",
-                    self._entity_id,
+                    self._config.entity_id,
                     len(target_dates)
                 )
                 
-                # Collect statistics for each target date
-                all_stats = []
+                # Completed days never gain new statistics, so their cached
+                # windows can be reused; only today's window (and any date
+                # not yet cached, e.g. on the first run) needs fetching
+                today: date = now.date()
+                stats = []
+                windows: list[tuple[datetime, datetime]] = []
+                fetch_dates: list[date] = []
+                # Localize the lookups used once per target date
+                as_utc = dt_util.as_utc
+                start_of_local_day = dt_util.start_of_local_day
+                window_cache = self._window_cache
+                debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
                 for target_date in target_dates:
-                    # Create start and end time for the target date (full day)
-                    start_time = dt_util.as_utc(dt_util.start_of_local_day(target_date))
-                    end_time = dt_util.as_utc(dt_util.start_of_local_day(target_date + timedelta(days=1)))
-                    
-                    _LOGGER.debug("Fetching statistics for date: %s (start: %s, end: %s)",
-                                 target_date.strftime("%Y-%m-%d"), start_time, end_time)
-                    
-                    # Fetch statistics for this specific date
-                    stats_result: dict[str, list[dict[str, Any]]] = await get_instance(self.hass).async_add_executor_job(
-                        statistics_during_period,
-                        self.hass,
-                        start_time,
-                        end_time,
-                        [self._entity_id],
-                        "hour",  # Hourly statistics
-                        None,  # No units conversion
-                        {"mean", "min", "max", "state"},  # Statistic types to retrieve
-                    )
-                    
-                    date_stats = stats_result.get(self._entity_id, [])
-                    all_stats.extend(date_stats)
-                    _LOGGER.debug("Retrieved %d statistics records for date %s",
-                                 len(date_stats), target_date.strftime("%Y-%m-%d"))
-                
-                stats = all_stats
-                _LOGGER.debug("Retrieved %d total hourly statistics records", len(stats))
+                    window_date = target_date.date()
+                    cached = window_cache.get(window_date)
+                    if cached is not None and window_date != today:
+                        stats.extend(cached)
+                        continue
+
+                    # Both boundaries go through start_of_local_day rather
+                    # than adding 24h to the start so DST days keep their
+                    # real 23/25-hour span
+                    start_time = as_utc(start_of_local_day(target_date))
+                    end_time = as_utc(start_of_local_day(target_date + _ONE_DAY))
+
+                    if debug_enabled:
+                        # strftime is only worth running when the message
+                        # will actually be emitted
+                        _LOGGER.debug("Statistics window for date: %s (start: %s, end: %s)",
+                                     target_date.strftime("%Y-%m-%d"), start_time, end_time)
+                    windows.append((start_time, end_time))
+                    fetch_dates.append(window_date)
+
+                if windows:
+                    # Fetch all uncached windows in a single executor job
+                    async with _RECORDER_SEMAPHORE:
+                        window_stats = await get_instance(self.hass).async_add_executor_job(
+                            _fetch_statistics_for_windows,
+                            self.hass,
+                            windows,
+                            self._config.entity_id,
+                            "hour",  # Hourly statistics
+                            {self._stat_key},  # Only the statistic type actually consumed
+                        )
+                    for window_date, date_stats in zip(fetch_dates, window_stats):
+                        window_cache[window_date] = date_stats
+                        stats.extend(date_stats)
+
+                # Evict cached days that are no longer target dates (e.g.
+                # after a day rollover changes the matching set)
+                wanted: set[date] = {target_date.date() for target_date in target_dates}
+                for cached_date in list(window_cache):
+                    if cached_date not in wanted:
+                        del window_cache[cached_date]
+
+                _LOGGER.debug(
+                    "Collected %d total hourly statistics records (%d windows fetched)",
+                    len(stats),
+                    len(windows),
+                )
                 
-                # Log a sample of the statistics data
-                if stats:
+                # Log a sample of the statistics data; the dict build is
+                # only worth doing when debug logging is actually enabled
+                if stats and _LOGGER.isEnabledFor(logging.DEBUG):
                     sample = stats[0]
                     _LOGGER.debug(
                         "Sample statistic record: start=%s, fields=%s",
@@ -389,8 +698,9 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
             self.async_write_ha_state()
             return
         
-        # Log some sample dates from stats
-        if stats:
+        # Log some sample dates from stats; skip the datetime conversions
+        # entirely unless debug logging is enabled
+        if stats and _LOGGER.isEnabledFor(logging.DEBUG):
             try:
                 sample_dates = []
                 for stat in stats[:3]:
@@ -403,92 +713,89 @@ class DayOfMonthSensor(SensorEntity, RestoreEntity):
             except Exception as ex:
                 _LOGGER.error("Error creating sample dates: %s", ex)
         
-        # Extract the values to track from the statistics
-        values: list[float] = []
-        _LOGGER.debug("Extracting '%s' values from statistics", self._track_value)
-        
-        for stat in stats:
-            try:
-                if self._track_value == TRACK_VALUE_MEAN and "mean" in stat:
-                    values.append(float(stat["mean"]))
-                elif self._track_value == TRACK_VALUE_MIN and "min" in stat:
-                    values.append(float(stat["min"]))
-                elif self._track_value == TRACK_VALUE_MAX and "max" in stat:
-                    values.append(float(stat["max"]))
-                elif self._track_value == TRACK_VALUE_STATE and "state" in stat:
-                    values.append(float(stat["state"]))
-            except (ValueError, TypeError) as ex:
-                _LOGGER.error("Error extracting value from stat: %s - %s", stat, ex)
-        
-        _LOGGER.debug("Extracted %d values for '%s'", len(values), self._track_value)
-        
-        # Log the extracted values
-        if values:
-            try:
-                sample_values = [round(v, 2) for v in values[:5]]
-                _LOGGER.debug("Sample values (up to 5): %s", sample_values)
-            except Exception as ex:
-                _LOGGER.error("Error formatting sample values: %s", ex)
-        
-        # Calculate the aggregation
-        _LOGGER.debug("Calculating '%s' aggregation on %d values", self._aggregation, len(values))
-        
-        if not values:
-            _LOGGER.debug("No historical data found for %s", self._entity_id)
-            self._attr_native_value = None
-        elif self._aggregation == AGGREGATION_MAXIMUM:
-            try:
-                self._attr_native_value = max(values)
-                _LOGGER.debug("Maximum value calculated: %s", self._attr_native_value)
-            except Exception as ex:
-                _LOGGER.error("Error calculating maximum: %s", ex)
-                self._attr_native_value = None
-        elif self._aggregation == AGGREGATION_MINIMUM:
+        # Extract the tracked values and calculate the aggregation
+        _LOGGER.debug(
+            "Calculating '%s' aggregation of '%s' values from %d records",
+            self._config.aggregation,
+            self._config.track_value,
+            len(stats),
+        )
+        values_iter = _iter_stat_values(stats, self._stat_key)
+
+        if self._config.aggregation == AGGREGATION_STD_DEV:
+            # Welford's online algorithm reduces the stream in a single pass
             try:
-                self._attr_native_value = min(values)
-                _LOGGER.debug("Minimum value calculated: %s", self._attr_native_value)
+                count, _, m2 = _welford(values_iter)
             except Exception as ex:
-                _LOGGER.error("Error calculating minimum: %s", ex)
+                _LOGGER.error("Error calculating %s: %s", self._config.aggregation, ex)
                 self._attr_native_value = None
-        elif self._aggregation == AGGREGATION_MEDIAN:
-            try:
-                # Handle the even number of data points case for median
-                if len(values) % 2 == 0 and values:
-                    sorted_values: list[float] = sorted(values)
-                    middle1: float = sorted_values[len(values) // 2 - 1]
-                    middle2: float = sorted_values[len(values) // 2]
-                    self._attr_native_value = (middle1 + middle2) / 2
-                    _LOGGER.debug(
-                        "Median calculated from even number of values (%d): %s (middle values: %s, %s)",
-                        len(values), self._attr_native_value, middle1, middle2
-                    )
+            else:
+                if count == 0:
+                    _LOGGER.debug("No historical data found for %s", self._config.entity_id)
+                    self._attr_native_value = None
+                elif count == 1:
+                    # Handle edge cases for standard deviation
+                    self._attr_native_value = None
+                    _LOGGER.debug("Standard deviation with one value: setting to None (unavailable)")
+                elif count == 2:
+                    self._attr_native_value = 0
+                    _LOGGER.debug("Standard deviation with two values: setting to 0")
                 else:
-                    self._attr_native_value = statistics.median(values)
-                    _LOGGER.debug("Median calculated: %s", self._attr_native_value)
-            except Exception as ex:
-                _LOGGER.error("Error calculating median: %s", ex)
-                self._attr_native_value = None
-        elif self._aggregation == AGGREGATION_MEAN:
+                    self._attr_native_value = math.sqrt(m2 / (count - 1))
+        elif self._config.aggregation == AGGREGATION_MEDIAN:
+            # Median needs the full sample list for selection
             try:
-                self._attr_native_value = statistics.mean(values)
-                _LOGGER.debug("Mean value calculated: %s", self._attr_native_value)
+                values: list[float] = list(values_iter)
             except Exception as ex:
-                _LOGGER.error("Error calculating mean: %s", ex)
+                _LOGGER.error("Error calculating %s: %s", self._config.aggregation, ex)
                 self._attr_native_value = None
-        elif self._aggregation == AGGREGATION_STD_DEV:
-            try:
-                # Handle edge cases for standard deviation
-                if len(values) == 1:
+            else:
+                n: int = len(values)
+                if n == 0:
+                    _LOGGER.debug("No historical data found for %s", self._config.entity_id)
                     self._attr_native_value = None
-                    _LOGGER.debug("Standard deviation with one value: setting to None (unavailable)")
-                elif len(values) == 2:
-                    self._attr_native_value = 0
-                    _LOGGER.debug("Standard deviation with two values: setting to 0")
+                elif n == 1:
+                    # A single sample is its own median
+                    self._attr_native_value = values[0]
                 else:
-                    self._attr_native_value = statistics.stdev(values)
-                    _LOGGER.debug("Standard deviation calculated: %s", self._attr_native_value)
+                    try:
+                        self._attr_native_value = self._aggregator(values)
+                    except Exception as ex:
+                        _LOGGER.error("Error calculating %s: %s", self._config.aggregation, ex)
+                        self._attr_native_value = None
+        else:
+            # Maximum, minimum and mean reduce the stream in a single pass
+            # without materializing an intermediate list
+            try:
+                self._attr_native_value = self._aggregator(values_iter)
+            except (ValueError, statistics.StatisticsError):
+                # Empty stream: no historical data for the tracked dates
+                _LOGGER.debug("No historical data found for %s", self._config.entity_id)
+                self._attr_native_value = None
             except Exception as ex:
-                _LOGGER.error("Error calculating standard deviation: %s", ex)
+                _LOGGER.error("Error calculating %s: %s", self._config.aggregation, ex)
                 self._attr_native_value = None
-        
+
+        _LOGGER.debug(
+            "'%s' aggregation calculated: %s",
+            self._config.aggregation,
+            self._attr_native_value,
+        )
+        self._last_update_ts = dt_util.utcnow()
+        self._last_day = (now.day, now.month)
+
+        # Only fire a state-changed event when the value actually moved;
+        # unchanged results would still trigger recorder writes and
+        # listener fan-out otherwise
+        new_value: Optional[float] = self._attr_native_value
+        if new_value is None and previous_value is None:
+            _LOGGER.debug("Value unchanged (None); skipping state write")
+            return
+        if (
+            new_value is not None
+            and previous_value is not None
+            and math.isclose(new_value, previous_value)
+        ):
+            _LOGGER.debug("Value unchanged (%s); skipping state write", new_value)
+            return
         self.async_write_ha_state()